@@ -5,10 +5,119 @@ Handles all database operations using SQLite
 
 import sqlite3
 import os
+import functools
+import threading
 from datetime import datetime
-from typing import List, Optional, Tuple
+from itertools import product
+from typing import Dict, Iterator, List, Optional, Tuple
 from .models import Employee, Area, EmployeeAreaRate, SalaryRecord, SalaryRecordView
 
+def _convert_timestamp(value: bytes) -> datetime:
+    """Convert a TIMESTAMP column value (ISO text or Unix seconds) to datetime"""
+    # Databases created before date_created moved to Unix seconds still
+    # declare that column TIMESTAMP, so accept both representations
+    if value.isdigit():
+        return datetime.fromtimestamp(int(value))
+    return datetime.fromisoformat(value.decode())
+
+# Parse TIMESTAMP columns into datetime inside the driver instead of calling
+# datetime.fromisoformat on every fetched row (also avoids relying on the
+# default converters deprecated in Python 3.12)
+sqlite3.register_converter("timestamp", _convert_timestamp)
+
+# salary_records.date_created holds integer Unix seconds; select it as
+# "date_created [epoch]" to get a local datetime back
+sqlite3.register_converter("epoch", lambda value: datetime.fromtimestamp(int(value)))
+
+# Full schema, run as a single script by initialize_database
+SCHEMA_DDL = """
+CREATE TABLE IF NOT EXISTS employees (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS areas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS employee_area_rates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id INTEGER NOT NULL,
+    area_id INTEGER NOT NULL,
+    base_salary REAL NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (employee_id) REFERENCES employees (id) ON DELETE CASCADE,
+    FOREIGN KEY (area_id) REFERENCES areas (id) ON DELETE CASCADE,
+    UNIQUE(employee_id, area_id)
+);
+
+CREATE TABLE IF NOT EXISTS salary_records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id INTEGER NOT NULL,
+    area_id INTEGER NOT NULL,
+    base_salary REAL NOT NULL,
+    allowance REAL DEFAULT 0,
+    total REAL NOT NULL,
+    date_created INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    FOREIGN KEY (employee_id) REFERENCES employees (id) ON DELETE CASCADE,
+    FOREIGN KEY (area_id) REFERENCES areas (id) ON DELETE CASCADE
+);
+
+-- Indexes backing the salary_records joins and date ordering
+CREATE INDEX IF NOT EXISTS idx_sr_emp ON salary_records (employee_id);
+CREATE INDEX IF NOT EXISTS idx_sr_area ON salary_records (area_id);
+CREATE INDEX IF NOT EXISTS idx_sr_date ON salary_records (date_created DESC);
+"""
+
+# PRAGMA user_version once salary_records.date_created holds Unix seconds
+_SCHEMA_VERSION_EPOCH_DATES = 1
+
+# INSERT ... RETURNING is available from SQLite 3.35
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Update the rate in place instead of INSERT OR REPLACE, which deletes the
+# old row (new id, cascades) before inserting the new one
+_UPSERT_RATE_SQL = """INSERT INTO employee_area_rates 
+       (employee_id, area_id, base_salary) VALUES (?, ?, ?)
+       ON CONFLICT (employee_id, area_id) DO UPDATE SET base_salary = excluded.base_salary"""
+
+# Hot-path statements, kept as module constants so every call passes the
+# same text and hits the connection's prepared statement cache
+_RATE_LOOKUP_SQL = "SELECT base_salary FROM employee_area_rates WHERE employee_id = ? AND area_id = ?"
+
+_INSERT_SALARY_SQL = """INSERT INTO salary_records 
+       (employee_id, area_id, base_salary, allowance, total, date_created) 
+       VALUES (?, ?, ?, ?, ?, ?)"""
+
+_INSERT_SALARY_RETURNING_SQL = _INSERT_SALARY_SQL + ' RETURNING id, date_created AS "date_created [epoch]"'
+
+_SALARY_RECORDS_SQL = """
+    SELECT s.id, e.name as employee_name, a.name as area_name,
+           s.base_salary, s.allowance, s.total,
+           s.date_created AS "date_created [epoch]",
+           strftime('%Y-%m-%d', s.date_created, 'unixepoch', 'localtime') AS date_str,
+           s.employee_id, s.area_id
+    FROM salary_records s
+    JOIN employees e ON s.employee_id = e.id
+    JOIN areas a ON s.area_id = a.id
+    ORDER BY s.date_created DESC
+    LIMIT ?
+"""
+
+# Pairs per get_rates_for_pairs query; two parameters each keeps us under
+# the 999 bound-variable limit of older SQLite builds
+_MAX_PAIRS_PER_QUERY = 400
+
+# Rows pulled per fetchmany() call by the streaming iter_* readers
+_FETCH_ARRAYSIZE = 200
+
+def _to_epoch(value: Optional[datetime]) -> int:
+    """Convert a record timestamp to Unix seconds, defaulting to now"""
+    return int((value or datetime.now()).timestamp())
+
 class DatabaseManager:
     """Manages all database operations"""
     
@@ -21,240 +130,345 @@ class DatabaseManager:
             db_path = os.path.join(data_dir, 'salary_management.db')
         
         self.db_path = db_path
-        self.connection = None
+        
+        # sqlite3 connections must not be shared between threads, so each
+        # thread lazily opens its own read/write (and optional read-only)
+        # connection. WAL mode lets those readers run alongside a writer.
+        # Note that every thread gets a separate database for ':memory:'.
+        # Connections are only closed by close_connection() on the thread
+        # that opened them, so worker threads must call it before exiting.
+        self._local = threading.local()
+        
+        # Memoized (employee_id, area_id) -> base salary lookups. The cache
+        # assumes this manager is the only writer to the database; changes
+        # made by another process are not seen until it is cleared.
+        self._rate_cache = functools.lru_cache(maxsize=256)(self._get_employee_area_rate_uncached)
+        
+        # Employee and area lists change rarely; cached until a mutating
+        # call invalidates them (same single-writer assumption as above)
+        self._employees_cache = None
+        self._areas_cache = None
     
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row
-        return self.connection
+        """Get the calling thread's database connection"""
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = self._open_connection()
+            self._local.connection = conn
+        return conn
+    
+    def get_reader(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's read-only connection, e.g. for worker threads
+        
+        The worker must call close_connection() itself when done; it is not
+        closed by the main thread's shutdown.
+        """
+        if self.db_path == ':memory:':
+            # A second connection would open a different, empty database
+            return self.get_connection()
+        
+        conn = getattr(self._local, 'reader', None)
+        if conn is None:
+            conn = self._open_connection()
+            conn.execute("PRAGMA query_only=1")
+            self._local.reader = conn
+        return conn
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new database connection"""
+        conn = sqlite3.connect(
+            self.db_path,
+            cached_statements=256,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure_connection(conn)
+        return conn
+    
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply performance PRAGMAs once to a freshly opened connection"""
+        # WAL replaces rollback journaling with sequential log appends and
+        # lets readers proceed while a writer is active. It is meaningless
+        # for in-memory databases, so skip it there.
+        if self.db_path != ':memory:':
+            conn.execute("PRAGMA journal_mode=WAL")
+        
+        conn.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA foreign_keys=ON;
+            PRAGMA mmap_size=268435456;
+        """)
     
     def close_connection(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """
+        Close the calling thread's database connections
+        
+        Only the caller's own connections are closed (sqlite3 forbids using
+        them from another thread); each worker thread that opened one must
+        call this before it exits.
+        """
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            # Upkeep is best effort; a busy database must not keep the
+            # connection open or turn a normal shutdown into an error
+            try:
+                self.maintenance()
+            except sqlite3.Error:
+                pass
+            finally:
+                conn.close()
+                self._local.connection = None
+        
+        reader = getattr(self._local, 'reader', None)
+        if reader is not None:
+            reader.close()
+            self._local.reader = None
+    
+    def maintenance(self):
+        """
+        Run periodic upkeep, e.g. on idle or before shutdown
+        
+        Refreshes query planner statistics and truncates the WAL file so it
+        does not keep growing between checkpoints.
+        """
+        conn = self.get_connection()
+        conn.execute("PRAGMA optimize")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     
     def initialize_database(self):
         """Create database tables if they don't exist"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Create employees table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS employees (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Create areas table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS areas (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Create employee_area_rates table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS employee_area_rates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                employee_id INTEGER NOT NULL,
-                area_id INTEGER NOT NULL,
-                base_salary REAL NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (employee_id) REFERENCES employees (id) ON DELETE CASCADE,
-                FOREIGN KEY (area_id) REFERENCES areas (id) ON DELETE CASCADE,
-                UNIQUE(employee_id, area_id)
-            )
-        ''')
-        
-        # Create salary_records table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS salary_records (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                employee_id INTEGER NOT NULL,
-                area_id INTEGER NOT NULL,
-                base_salary REAL NOT NULL,
-                allowance REAL DEFAULT 0,
-                total REAL NOT NULL,
-                date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (employee_id) REFERENCES employees (id) ON DELETE CASCADE,
-                FOREIGN KEY (area_id) REFERENCES areas (id) ON DELETE CASCADE
-            )
-        ''')
-        
-        conn.commit()
+        conn.executescript(SCHEMA_DDL)
+        self._migrate_schema(conn)
         
         # Add sample data if tables are empty
         self._add_sample_data()
     
+    def _migrate_schema(self, conn: sqlite3.Connection):
+        """Upgrade data written by older versions of the schema"""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        
+        if version < _SCHEMA_VERSION_EPOCH_DATES:
+            # Older databases stored date_created as CURRENT_TIMESTAMP text (UTC)
+            with conn:
+                conn.execute("""
+                    UPDATE salary_records
+                    SET date_created = CAST(strftime('%s', date_created) AS INTEGER)
+                    WHERE typeof(date_created) = 'text'
+                """)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION_EPOCH_DATES}")
+    
     def _add_sample_data(self):
         """Add sample data if database is empty"""
         conn = self.get_connection()
-        cursor = conn.cursor()
         
-        # Check if we have any employees
-        cursor.execute("SELECT COUNT(*) FROM employees")
-        if cursor.fetchone()[0] == 0:
-            # Add sample employees
+        # Check if we have any employees (stops at the first row, unlike COUNT(*))
+        cursor = conn.execute("SELECT 1 FROM employees LIMIT 1")
+        if cursor.fetchone() is None:
             sample_employees = ["أحمد محمد", "فاطمة علي", "محمود حسن", "نور الدين"]
-            for name in sample_employees:
-                self.add_employee(Employee(name=name))
-            
-            # Add sample areas
             sample_areas = ["القاهرة", "الجيزة", "الإسكندرية", "المنصورة"]
-            for name in sample_areas:
-                self.add_area(Area(name=name))
-            
-            # Add sample rates
-            employees = self.get_all_employees()
-            areas = self.get_all_areas()
-            
             base_rates = [3000, 3500, 4000, 4500]  # Different base rates
             
-            for i, employee in enumerate(employees):
-                for j, area in enumerate(areas):
-                    # Each employee has different rate per area
-                    rate = base_rates[i] + (j * 200)  # Variation per area
-                    self.add_employee_area_rate(EmployeeAreaRate(
-                        employee_id=employee.id,
-                        area_id=area.id,
-                        base_salary=rate
-                    ))
+            # Seed everything in a single transaction instead of committing
+            # once per row through the add_* helpers
+            with conn:
+                conn.executemany(
+                    "INSERT INTO employees (name) VALUES (?)",
+                    [(name,) for name in sample_employees]
+                )
+                conn.executemany(
+                    "INSERT INTO areas (name) VALUES (?)",
+                    [(name,) for name in sample_areas]
+                )
+                
+                employee_ids = [row['id'] for row in
+                                conn.execute("SELECT id FROM employees ORDER BY name")]
+                area_ids = [row['id'] for row in
+                            conn.execute("SELECT id FROM areas ORDER BY name")]
+                
+                # Each employee has different rate per area
+                rates = [
+                    (employee_id, area_id, base_rates[i] + (j * 200))  # Variation per area
+                    for (i, employee_id), (j, area_id)
+                    in product(enumerate(employee_ids), enumerate(area_ids))
+                ]
+                conn.executemany(_UPSERT_RATE_SQL, rates)
+            self._rate_cache.cache_clear()
+            self._employees_cache = None
+            self._areas_cache = None
     
     # Employee operations
     def add_employee(self, employee: Employee) -> int:
         """Add new employee"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "INSERT INTO employees (name) VALUES (?)",
-            (employee.name,)
-        )
-        conn.commit()
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO employees (name) VALUES (?)",
+                (employee.name,)
+            )
+        self._employees_cache = None
         return cursor.lastrowid
     
     def get_all_employees(self) -> List[Employee]:
         """Get all employees"""
+        if self._employees_cache is None:
+            self._employees_cache = list(self.iter_employees())
+        return list(self._employees_cache)
+    
+    def iter_employees(self) -> Iterator[Employee]:
+        """Stream all employees without materializing the full list"""
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.arraysize = _FETCH_ARRAYSIZE
         
-        cursor.execute("SELECT * FROM employees ORDER BY name")
-        rows = cursor.fetchall()
+        cursor.execute('SELECT id, name, created_at AS "created_at [timestamp]" FROM employees ORDER BY name')
         
-        return [Employee(
-            id=row['id'],
-            name=row['name'],
-            created_at=datetime.fromisoformat(row['created_at'])
-        ) for row in rows]
+        while rows := cursor.fetchmany():
+            for row in rows:
+                yield Employee(
+                    id=row['id'],
+                    name=row['name'],
+                    created_at=row['created_at']
+                )
     
     def update_employee(self, employee: Employee) -> bool:
         """Update employee"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "UPDATE employees SET name = ? WHERE id = ?",
-            (employee.name, employee.id)
-        )
-        conn.commit()
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "UPDATE employees SET name = ? WHERE id = ?",
+                (employee.name, employee.id)
+            )
+        self._employees_cache = None
         return cursor.rowcount > 0
     
     def delete_employee(self, employee_id: int) -> bool:
         """Delete employee"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM employees WHERE id = ?", (employee_id,))
-        conn.commit()
+        with self.get_connection() as conn:
+            cursor = conn.execute("DELETE FROM employees WHERE id = ?", (employee_id,))
+        self._rate_cache.cache_clear()
+        self._employees_cache = None
         return cursor.rowcount > 0
     
     # Area operations
     def add_area(self, area: Area) -> int:
         """Add new area"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "INSERT INTO areas (name) VALUES (?)",
-            (area.name,)
-        )
-        conn.commit()
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO areas (name) VALUES (?)",
+                (area.name,)
+            )
+        self._areas_cache = None
         return cursor.lastrowid
     
     def get_all_areas(self) -> List[Area]:
         """Get all areas"""
+        if self._areas_cache is None:
+            self._areas_cache = list(self.iter_areas())
+        return list(self._areas_cache)
+    
+    def iter_areas(self) -> Iterator[Area]:
+        """Stream all areas without materializing the full list"""
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.arraysize = _FETCH_ARRAYSIZE
         
-        cursor.execute("SELECT * FROM areas ORDER BY name")
-        rows = cursor.fetchall()
+        cursor.execute('SELECT id, name, created_at AS "created_at [timestamp]" FROM areas ORDER BY name')
         
-        return [Area(
-            id=row['id'],
-            name=row['name'],
-            created_at=datetime.fromisoformat(row['created_at'])
-        ) for row in rows]
+        while rows := cursor.fetchmany():
+            for row in rows:
+                yield Area(
+                    id=row['id'],
+                    name=row['name'],
+                    created_at=row['created_at']
+                )
     
     def update_area(self, area: Area) -> bool:
         """Update area"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "UPDATE areas SET name = ? WHERE id = ?",
-            (area.name, area.id)
-        )
-        conn.commit()
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "UPDATE areas SET name = ? WHERE id = ?",
+                (area.name, area.id)
+            )
+        self._areas_cache = None
         return cursor.rowcount > 0
     
     def delete_area(self, area_id: int) -> bool:
         """Delete area"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM areas WHERE id = ?", (area_id,))
-        conn.commit()
+        with self.get_connection() as conn:
+            cursor = conn.execute("DELETE FROM areas WHERE id = ?", (area_id,))
+        self._rate_cache.cache_clear()
+        self._areas_cache = None
         return cursor.rowcount > 0
     
     # Employee Area Rate operations
     def add_employee_area_rate(self, rate: EmployeeAreaRate) -> int:
         """Add or update employee area rate"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        params = (rate.employee_id, rate.area_id, rate.base_salary)
         
-        cursor.execute(
-            """INSERT OR REPLACE INTO employee_area_rates 
-               (employee_id, area_id, base_salary) VALUES (?, ?, ?)""",
-            (rate.employee_id, rate.area_id, rate.base_salary)
-        )
-        conn.commit()
-        return cursor.lastrowid
+        with self.get_connection() as conn:
+            if _SUPPORTS_RETURNING:
+                rate_id = conn.execute(_UPSERT_RATE_SQL + " RETURNING id", params).fetchone()['id']
+            else:
+                # lastrowid is not updated when the DO UPDATE branch runs
+                conn.execute(_UPSERT_RATE_SQL, params)
+                rate_id = conn.execute(
+                    "SELECT id FROM employee_area_rates WHERE employee_id = ? AND area_id = ?",
+                    (rate.employee_id, rate.area_id)
+                ).fetchone()['id']
+        
+        self._rate_cache.cache_clear()
+        return rate_id
     
     def get_employee_area_rate(self, employee_id: int, area_id: int) -> Optional[float]:
         """Get base salary for employee in specific area"""
+        return self._rate_cache(employee_id, area_id)
+    
+    def _get_employee_area_rate_uncached(self, employee_id: int, area_id: int) -> Optional[float]:
+        """Look up base salary for employee in specific area from the database"""
         conn = self.get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute(
-            "SELECT base_salary FROM employee_area_rates WHERE employee_id = ? AND area_id = ?",
-            (employee_id, area_id)
-        )
+        cursor = conn.execute(_RATE_LOOKUP_SQL, (employee_id, area_id))
         row = cursor.fetchone()
         return row['base_salary'] if row else None
     
+    def get_rates_for_pairs(self, pairs: List[Tuple[int, int]]) -> Dict[Tuple[int, int], float]:
+        """
+        Get base salaries for many (employee_id, area_id) pairs at once
+        
+        Args:
+            pairs: (employee_id, area_id) pairs to look up
+        
+        Returns:
+            Dict mapping each pair that has a rate to its base salary
+        """
+        conn = self.get_connection()
+        
+        unique_pairs = list(dict.fromkeys(pairs))
+        rates = {}
+        
+        for start in range(0, len(unique_pairs), _MAX_PAIRS_PER_QUERY):
+            chunk = unique_pairs[start:start + _MAX_PAIRS_PER_QUERY]
+            placeholders = ", ".join(["(?, ?)"] * len(chunk))
+            cursor = conn.execute(
+                f"""WITH pairs (employee_id, area_id) AS (VALUES {placeholders})
+                    SELECT r.employee_id, r.area_id, r.base_salary
+                    FROM pairs p
+                    JOIN employee_area_rates r
+                      ON r.employee_id = p.employee_id AND r.area_id = p.area_id""",
+                [value for pair in chunk for value in pair]
+            )
+            rates.update({(row['employee_id'], row['area_id']): row['base_salary']
+                          for row in cursor.fetchall()})
+        
+        return rates
+    
     def get_all_employee_area_rates(self) -> List[Tuple[str, str, float]]:
         """Get all employee area rates with names"""
         conn = self.get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute("""
+        cursor = conn.execute("""
             SELECT e.name as employee_name, a.name as area_name, r.base_salary
             FROM employee_area_rates r
             JOIN employees e ON r.employee_id = e.id
@@ -266,78 +480,138 @@ class DatabaseManager:
                 for row in cursor.fetchall()]
     
     # Salary Record operations
-    def add_salary_record(self, record: SalaryRecord) -> int:
-        """Add new salary record"""
+    def add_salary_record(self, record: SalaryRecord) -> Tuple[int, datetime]:
+        """
+        Add new salary record
+        
+        Returns:
+            Tuple of (record_id, date_created) as stored in the database
+        """
+        params = (record.employee_id, record.area_id, record.base_salary,
+                  record.allowance, record.total, _to_epoch(record.date_created))
+        
+        with self.get_connection() as conn:
+            if _SUPPORTS_RETURNING:
+                row = conn.execute(_INSERT_SALARY_RETURNING_SQL, params).fetchone()
+                return row['id'], row['date_created']
+            
+            cursor = conn.execute(_INSERT_SALARY_SQL, params)
+            return cursor.lastrowid, datetime.fromtimestamp(params[-1])
+    
+    def add_salary_records_bulk(self, records: List[SalaryRecord], chunk_size: int = 500) -> int:
+        """
+        Add many salary records using one transaction per chunk
+        
+        Args:
+            records: Salary records to insert
+            chunk_size: Rows committed per transaction, bounds WAL growth
+        
+        Returns:
+            int: Number of inserted records
+        
+        Raises:
+            ValueError: If chunk_size is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        
         conn = self.get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute(
-            """INSERT INTO salary_records 
-               (employee_id, area_id, base_salary, allowance, total) 
-               VALUES (?, ?, ?, ?, ?)""",
-            (record.employee_id, record.area_id, record.base_salary, 
-             record.allowance, record.total)
-        )
-        conn.commit()
-        return cursor.lastrowid
+        params = [(r.employee_id, r.area_id, r.base_salary, r.allowance, r.total,
+                   _to_epoch(r.date_created))
+                  for r in records]
+        
+        for start in range(0, len(params), chunk_size):
+            with conn:
+                conn.executemany(_INSERT_SALARY_SQL, params[start:start + chunk_size])
+        
+        return len(params)
     
     def get_all_salary_records(self) -> List[SalaryRecordView]:
         """Get all salary records with employee and area names"""
+        return list(self.iter_salary_records())
+    
+    def get_recent_salary_records(self, limit: int = 20) -> List[SalaryRecordView]:
+        """Get the most recent salary records, limited in SQL"""
+        return list(self.iter_salary_records(limit))
+    
+    def iter_salary_records(self, limit: Optional[int] = None) -> Iterator[SalaryRecordView]:
+        """Stream salary records with employee and area names, newest first"""
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.arraysize = _FETCH_ARRAYSIZE
+        # Plain tuples on this hot path: positional unpacking avoids a
+        # sqlite3.Row name lookup for every column of every row
+        cursor.row_factory = None
         
-        cursor.execute("""
-            SELECT s.id, e.name as employee_name, a.name as area_name,
-                   s.base_salary, s.allowance, s.total, s.date_created,
-                   s.employee_id, s.area_id
-            FROM salary_records s
-            JOIN employees e ON s.employee_id = e.id
-            JOIN areas a ON s.area_id = a.id
-            ORDER BY s.date_created DESC
-        """)
+        # LIMIT -1 means no limit
+        cursor.execute(_SALARY_RECORDS_SQL, (-1 if limit is None else limit,))
         
-        return [SalaryRecordView(
-            id=row['id'],
-            employee_name=row['employee_name'],
-            area_name=row['area_name'],
-            base_salary=row['base_salary'],
-            allowance=row['allowance'],
-            total=row['total'],
-            date_created=datetime.fromisoformat(row['date_created']),
-            employee_id=row['employee_id'],
-            area_id=row['area_id']
-        ) for row in cursor.fetchall()]
+        while rows := cursor.fetchmany():
+            for (record_id, employee_name, area_name, base_salary, allowance,
+                 total, date_created, date_str, employee_id, area_id) in rows:
+                yield SalaryRecordView(
+                    id=record_id,
+                    employee_name=employee_name,
+                    area_name=area_name,
+                    base_salary=base_salary,
+                    allowance=allowance,
+                    total=total,
+                    date_created=date_created,
+                    date_str=date_str or '',
+                    employee_id=employee_id,
+                    area_id=area_id
+                )
     
     def update_salary_record(self, record: SalaryRecord) -> bool:
         """Update salary record"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """UPDATE salary_records 
-               SET employee_id = ?, area_id = ?, base_salary = ?, 
-                   allowance = ?, total = ? 
-               WHERE id = ?""",
-            (record.employee_id, record.area_id, record.base_salary,
-             record.allowance, record.total, record.id)
-        )
-        conn.commit()
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                """UPDATE salary_records 
+                   SET employee_id = ?, area_id = ?, base_salary = ?, 
+                       allowance = ?, total = ? 
+                   WHERE id = ?""",
+                (record.employee_id, record.area_id, record.base_salary,
+                 record.allowance, record.total, record.id)
+            )
         return cursor.rowcount > 0
     
     def delete_salary_record(self, record_id: int) -> bool:
         """Delete salary record"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM salary_records WHERE id = ?", (record_id,))
-        conn.commit()
+        with self.get_connection() as conn:
+            cursor = conn.execute("DELETE FROM salary_records WHERE id = ?", (record_id,))
         return cursor.rowcount > 0
     
     def get_total_salaries(self) -> float:
         """Get grand total of all salary records"""
         conn = self.get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute("SELECT SUM(total) as grand_total FROM salary_records")
+        cursor = conn.execute("SELECT SUM(total) as grand_total FROM salary_records")
         row = cursor.fetchone()
         return row['grand_total'] if row['grand_total'] else 0.0
+    
+    def get_totals_by_employee(self) -> Dict[str, float]:
+        """Get salary totals per employee name, aggregated in SQL"""
+        conn = self.get_connection()
+        
+        cursor = conn.execute("""
+            SELECT e.name as employee_name, SUM(s.total) as employee_total
+            FROM salary_records s
+            JOIN employees e ON s.employee_id = e.id
+            GROUP BY s.employee_id
+        """)
+        
+        return {row['employee_name']: row['employee_total'] for row in cursor.fetchall()}
+    
+    def get_totals_by_area(self) -> Dict[str, float]:
+        """Get salary totals per area name, aggregated in SQL"""
+        conn = self.get_connection()
+        
+        cursor = conn.execute("""
+            SELECT a.name as area_name, SUM(s.total) as area_total
+            FROM salary_records s
+            JOIN areas a ON s.area_id = a.id
+            GROUP BY s.area_id
+        """)
+        
+        return {row['area_name']: row['area_total'] for row in cursor.fetchall()}
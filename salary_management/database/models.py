@@ -2,46 +2,34 @@
 Data models for Employee Salary Management System
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Employee:
     """Employee data model"""
     id: Optional[int] = None
     name: str = ""
-    created_at: Optional[datetime] = None
-    
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Area:
     """Work area data model"""
     id: Optional[int] = None
     name: str = ""
-    created_at: Optional[datetime] = None
-    
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmployeeAreaRate:
     """Employee rate per area data model"""
     id: Optional[int] = None
     employee_id: int = 0
     area_id: int = 0
     base_salary: float = 0.0
-    created_at: Optional[datetime] = None
-    
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SalaryRecord:
     """Salary calculation record data model"""
     id: Optional[int] = None
@@ -50,15 +38,21 @@ class SalaryRecord:
     base_salary: float = 0.0
     allowance: float = 0.0
     total: float = 0.0
-    date_created: Optional[datetime] = None
+    date_created: Optional[datetime] = field(default_factory=datetime.now)
     
-    def __post_init__(self):
-        if self.date_created is None:
-            self.date_created = datetime.now()
-        # Calculate total automatically
-        self.total = self.base_salary + self.allowance
+    @classmethod
+    def compute(cls, employee_id: int, area_id: int, base_salary: float,
+                allowance: float = 0.0) -> 'SalaryRecord':
+        """Create a new record with total calculated from base salary and allowance"""
+        return cls(
+            employee_id=employee_id,
+            area_id=area_id,
+            base_salary=base_salary,
+            allowance=allowance,
+            total=base_salary + allowance
+        )
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SalaryRecordView:
     """Extended salary record with employee and area names for display"""
     id: Optional[int] = None
@@ -68,5 +62,6 @@ class SalaryRecordView:
     allowance: float = 0.0
     total: float = 0.0
     date_created: Optional[datetime] = None
+    date_str: str = ""  # date_created as YYYY-MM-DD, formatted by SQLite
     employee_id: int = 0
     area_id: int = 0
@@ -8,6 +8,33 @@ from database.db_manager import DatabaseManager
 from database.models import SalaryRecord
 from .styles import COLORS, FONTS, PADDING, BUTTON_STYLES, ENTRY_STYLE
 
+# Delay before recalculating the total after the last keystroke
+CALC_DEBOUNCE_MS = 80
+
+def configure_row_tags(tree: ttk.Treeview):
+    """Define the alternating row backgrounds used by populate_tree once"""
+    tree.tag_configure('odd', background=COLORS['white'])
+    tree.tag_configure('even', background=COLORS.get('light', '#f6f6f6'))
+
+def populate_tree(tree: ttk.Treeview, rows, before=None):
+    """
+    Insert rows into a packed treeview in one batch
+    
+    The tree is unmapped while inserting so Tk lays it out and redraws
+    once at the end instead of after every row.
+    
+    Args:
+        tree: Treeview packed with side=LEFT, fill=BOTH, expand=True
+        rows: Tuples of column values
+        before: Sibling the tree was packed before (keeps packing order)
+    """
+    tree.pack_forget()
+    try:
+        for i, values in enumerate(rows):
+            tree.insert('', tk.END, values=values, tags=('odd' if i & 1 else 'even',))
+    finally:
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=before)
+
 class SalaryForm:
     """Salary calculation form class"""
     
@@ -18,8 +45,11 @@ class SalaryForm:
         
         self.employees = []
         self.areas = []
+        self._emp_id_by_name = {}
+        self._area_id_by_name = {}
         self.selected_employee_id = None
         self.selected_area_id = None
+        self._calc_job = None
         
         self.create_widgets()
         self.load_data()
@@ -213,14 +243,15 @@ class SalaryForm:
         self.records_tree.column('Allowance', width=100, anchor=tk.CENTER)
         self.records_tree.column('Total', width=100, anchor=tk.CENTER)
         self.records_tree.column('Date', width=120, anchor=tk.CENTER)
+        configure_row_tags(self.records_tree)
         
         # Add scrollbar
-        records_scrollbar = ttk.Scrollbar(records_frame, orient=tk.VERTICAL, command=self.records_tree.yview)
-        self.records_tree.configure(yscrollcommand=records_scrollbar.set)
+        self.records_scrollbar = ttk.Scrollbar(records_frame, orient=tk.VERTICAL, command=self.records_tree.yview)
+        self.records_tree.configure(yscrollcommand=self.records_scrollbar.set)
         
         # Pack treeview and scrollbar
         self.records_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        records_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.records_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Load recent records
         self.load_recent_records()
@@ -232,37 +263,25 @@ class SalaryForm:
             self.employees = self.db_manager.get_all_employees()
             employee_names = [emp.name for emp in self.employees]
             self.employee_combo['values'] = employee_names
+            self._emp_id_by_name = {emp.name: emp.id for emp in self.employees}
             
             # Load areas
             self.areas = self.db_manager.get_all_areas()
             area_names = [area.name for area in self.areas]
             self.area_combo['values'] = area_names
+            self._area_id_by_name = {area.name: area.id for area in self.areas}
             
         except Exception as e:
             messagebox.showerror("خطأ", f"خطأ في تحميل البيانات: {str(e)}")
     
     def on_employee_select(self, event):
         """Handle employee selection"""
-        selected_name = self.employee_var.get()
-        self.selected_employee_id = None
-        
-        for emp in self.employees:
-            if emp.name == selected_name:
-                self.selected_employee_id = emp.id
-                break
-        
+        self.selected_employee_id = self._emp_id_by_name.get(self.employee_var.get())
         self.update_base_salary()
     
     def on_area_select(self, event):
         """Handle area selection"""
-        selected_name = self.area_var.get()
-        self.selected_area_id = None
-        
-        for area in self.areas:
-            if area.name == selected_name:
-                self.selected_area_id = area.id
-                break
-        
+        self.selected_area_id = self._area_id_by_name.get(self.area_var.get())
         self.update_base_salary()
     
     def update_base_salary(self):
@@ -292,7 +311,18 @@ class SalaryForm:
             self.calculate_total()
     
     def calculate_total(self, event=None):
-        """Calculate total salary"""
+        """Calculate total salary, debounced when triggered by key events"""
+        if event is None:
+            self._do_calculate_total()
+            return
+        
+        if self._calc_job is not None:
+            self.parent.after_cancel(self._calc_job)
+        self._calc_job = self.parent.after(CALC_DEBOUNCE_MS, self._do_calculate_total)
+    
+    def _do_calculate_total(self):
+        """Recalculate the total from the current base salary and allowance"""
+        self._calc_job = None
         try:
             base_salary = float(self.base_salary_var.get())
             allowance = float(self.allowance_var.get() or "0")
@@ -319,7 +349,7 @@ class SalaryForm:
                 messagebox.showerror("خطأ", "المرتب الأساسي يجب أن يكون أكبر من صفر")
                 return
             
-            record = SalaryRecord(
+            record = SalaryRecord.compute(
                 employee_id=self.selected_employee_id,
                 area_id=self.selected_area_id,
                 base_salary=base_salary,
@@ -353,24 +383,24 @@ class SalaryForm:
     def load_recent_records(self):
         """Load recent salary records"""
         # Clear existing items
-        for item in self.records_tree.get_children():
-            self.records_tree.delete(item)
+        self.records_tree.delete(*self.records_tree.get_children())
         
         try:
-            records = self.db_manager.get_all_salary_records()
             # Show only the last 20 records
-            recent_records = records[:20]
+            recent_records = self.db_manager.get_recent_salary_records(20)
             
-            for record in recent_records:
-                date_str = record.date_created.strftime('%Y-%m-%d') if record.date_created else ''
-                self.records_tree.insert('', tk.END, values=(
-                    record.employee_name,
-                    record.area_name,
-                    f"{record.base_salary:.2f}",
-                    f"{record.allowance:.2f}",
-                    f"{record.total:.2f}",
-                    date_str
-                ))
+            # Build all rows before touching the widget so no Python work is
+            # interleaved with the Tcl calls
+            rows = [(
+                record.employee_name,
+                record.area_name,
+                f"{record.base_salary:.2f}",
+                f"{record.allowance:.2f}",
+                f"{record.total:.2f}",
+                record.date_str
+            ) for record in recent_records]
+            
+            populate_tree(self.records_tree, rows, before=self.records_scrollbar)
         except Exception as e:
             messagebox.showerror("خطأ", f"خطأ في تحميل السجلات: {str(e)}")
     
@@ -444,14 +474,15 @@ class RatesManagementForm:
         self.rates_tree.column('Employee', width=300, anchor=tk.E)
         self.rates_tree.column('Area', width=200, anchor=tk.E)
         self.rates_tree.column('Rate', width=150, anchor=tk.CENTER)
+        configure_row_tags(self.rates_tree)
         
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.rates_tree.yview)
-        self.rates_tree.configure(yscrollcommand=scrollbar.set)
+        self.rates_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.rates_tree.yview)
+        self.rates_tree.configure(yscrollcommand=self.rates_scrollbar.set)
         
         # Pack treeview and scrollbar
         self.rates_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.rates_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Close button
         close_frame = tk.Frame(main_frame, bg=COLORS['white'])
@@ -479,17 +510,14 @@ class RatesManagementForm:
     def load_rates(self):
         """Load rates into the treeview"""
         # Clear existing items
-        for item in self.rates_tree.get_children():
-            self.rates_tree.delete(item)
+        self.rates_tree.delete(*self.rates_tree.get_children())
         
         try:
             rates = self.db_manager.get_all_employee_area_rates()
-            for employee_name, area_name, rate in rates:
-                self.rates_tree.insert('', tk.END, values=(
-                    employee_name,
-                    area_name,
-                    f"{rate:.2f}"
-                ))
+            rows = [(employee_name, area_name, f"{rate:.2f}")
+                    for employee_name, area_name, rate in rates]
+            
+            populate_tree(self.rates_tree, rows, before=self.rates_scrollbar)
         except Exception as e:
             messagebox.showerror("خطأ", f"خطأ في تحميل الأسعار: {str(e)}")
     
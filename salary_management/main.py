@@ -6,6 +6,7 @@ Main application entry point
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import sqlite3
 import sys
 import os
 
@@ -15,6 +16,22 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from gui.main_window import MainWindow
 from database.db_manager import DatabaseManager
 
+# How often the database maintenance runs while the app is open
+MAINTENANCE_INTERVAL_MS = 15 * 60 * 1000
+
+def schedule_maintenance(root, db_manager, interval_ms=MAINTENANCE_INTERVAL_MS):
+    """Run database maintenance periodically from the Tk event loop"""
+    def run():
+        try:
+            db_manager.maintenance()
+        except sqlite3.Error:
+            # Maintenance is best effort (e.g. the database may be busy);
+            # try again on the next tick
+            pass
+        root.after(interval_ms, run)
+    
+    root.after(interval_ms, run)
+
 def main():
     """Main application entry point"""
     try:
@@ -34,9 +51,14 @@ def main():
         y = (root.winfo_screenheight() // 2) - (height // 2)
         root.geometry(f'{width}x{height}+{x}+{y}')
         
+        # Keep the WAL file and planner statistics in shape while running
+        schedule_maintenance(root, db_manager)
+        
         # Start the application
         root.mainloop()
         
+        db_manager.close_connection()
+        
     except Exception as e:
         messagebox.showerror("خطأ في التطبيق", f"حدث خطأ في تشغيل التطبيق:\n{str(e)}")
         sys.exit(1)
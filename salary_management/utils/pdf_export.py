@@ -3,8 +3,10 @@ PDF export utilities for Employee Salary Management System
 """
 
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import List
+import numpy as np
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -14,6 +16,85 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from database.models import SalaryRecordView
 
+# Background workers for building PDFs off the Tk main thread
+_pdf_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pdf-export')
+
+# Styles are constant, so build them once at import instead of per export
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    spaceAfter=30,
+    alignment=1,  # Center alignment
+    textColor=colors.darkblue
+)
+
+_HEADER_STYLE = ParagraphStyle(
+    'CustomHeader',
+    parent=_STYLES['Normal'],
+    fontSize=12,
+    spaceAfter=20,
+    alignment=1  # Center alignment
+)
+
+_SUMMARY_STYLE = ParagraphStyle(
+    'Summary',
+    parent=_STYLES['Normal'],
+    fontSize=14,
+    alignment=1,
+    textColor=colors.darkblue
+)
+
+_FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    alignment=1,
+    textColor=colors.grey
+)
+
+_SALARY_TABLE_STYLE = TableStyle([
+    # Header row
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    
+    # Data rows
+    ('FONTNAME', (0, 1), (-1, -2), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -2), 10),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.beige, colors.white]),
+    
+    # Total row
+    ('BACKGROUND', (0, -1), (-1, -1), colors.lightblue),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, -1), (-1, -1), 12),
+    
+    # Grid
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+_SIMPLE_TABLE_COMMANDS = [
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+]
+
+_SIMPLE_TABLE_STYLE = TableStyle(_SIMPLE_TABLE_COMMANDS)
+
+_RATES_TABLE_STYLE = TableStyle(_SIMPLE_TABLE_COMMANDS + [
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
+])
+
 def setup_arabic_font():
     """Setup Arabic font for PDF generation"""
     try:
@@ -34,6 +115,31 @@ def export_salary_records_to_pdf(records: List[SalaryRecordView], filename: str
     Returns:
         str: Path to the generated PDF file
     """
+    return _build_salary_report(records, _salary_report_path(filename))
+
+def export_salary_records_to_pdf_async(records: List[SalaryRecordView], filename: str = None) -> Future:
+    """
+    Export salary records to PDF file in a background thread
+    
+    The output path is resolved on the calling thread; the worker only
+    runs ReportLab, so callers must not touch Tk widgets from callbacks
+    directly. Marshal completion back to the UI thread instead, e.g.:
+    
+        future = export_salary_records_to_pdf_async(records)
+        future.add_done_callback(lambda f: root.after(0, show_result, f))
+    
+    Args:
+        records: List of salary records to export
+        filename: Optional filename, if not provided, auto-generated
+    
+    Returns:
+        Future: Resolves to the path of the generated PDF file
+    """
+    filepath = _salary_report_path(filename)
+    return _pdf_executor.submit(_build_salary_report, list(records), filepath)
+
+def _salary_report_path(filename: str = None) -> str:
+    """Resolve the output path for a salary report, creating reports/"""
     if filename is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"salary_report_{timestamp}.pdf"
@@ -46,8 +152,10 @@ def export_salary_records_to_pdf(records: List[SalaryRecordView], filename: str
     reports_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'reports')
     os.makedirs(reports_dir, exist_ok=True)
     
-    filepath = os.path.join(reports_dir, filename)
-    
+    return os.path.join(reports_dir, filename)
+
+def _build_salary_report(records: List[SalaryRecordView], filepath: str) -> str:
+    """Build the salary report PDF at filepath (no Tk or database access)"""
     # Setup Arabic font
     setup_arabic_font()
     
@@ -64,40 +172,19 @@ def export_salary_records_to_pdf(records: List[SalaryRecordView], filename: str
     # Container for the 'Flowable' objects
     elements = []
     
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=30,
-        alignment=1,  # Center alignment
-        textColor=colors.darkblue
-    )
-    
-    header_style = ParagraphStyle(
-        'CustomHeader',
-        parent=styles['Normal'],
-        fontSize=12,
-        spaceAfter=20,
-        alignment=1  # Center alignment
-    )
-    
     # Add title
-    title = Paragraph("تقرير مرتبات العمال", title_style)
+    title = Paragraph("تقرير مرتبات العمال", _TITLE_STYLE)
     elements.append(title)
     
     # Add report info
     current_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-    report_info = Paragraph(f"تاريخ التقرير: {current_date}", header_style)
+    report_info = Paragraph(f"تاريخ التقرير: {current_date}", _HEADER_STYLE)
     elements.append(report_info)
     
     elements.append(Spacer(1, 20))
     
     if not records:
-        no_data = Paragraph("لا توجد بيانات للعرض", header_style)
+        no_data = Paragraph("لا توجد بيانات للعرض", _HEADER_STYLE)
         elements.append(no_data)
     else:
         # Create table data
@@ -105,18 +192,23 @@ def export_salary_records_to_pdf(records: List[SalaryRecordView], filename: str
             ['التاريخ', 'الإجمالي', 'البدل', 'المرتب الأساسي', 'المنطقة', 'الموظف']
         ]
         
-        total_sum = 0
-        for record in records:
-            date_str = record.date_created.strftime('%Y-%m-%d') if record.date_created else ''
-            table_data.append([
-                date_str,
-                f"{record.total:.2f}",
-                f"{record.allowance:.2f}",
-                f"{record.base_salary:.2f}",
-                record.area_name,
-                record.employee_name
-            ])
-            total_sum += record.total
+        # Pull the numeric columns into arrays once, then sum and format
+        # them in vectorized passes instead of per-row Python arithmetic
+        count = len(records)
+        totals = np.fromiter((r.total for r in records), dtype=np.float64, count=count)
+        allowances = np.fromiter((r.allowance for r in records), dtype=np.float64, count=count)
+        bases = np.fromiter((r.base_salary for r in records), dtype=np.float64, count=count)
+        total_sum = float(totals.sum())
+        
+        table_data.extend(
+            [record.date_str, total_str, allowance_str, base_str, record.area_name, record.employee_name]
+            for record, total_str, allowance_str, base_str in zip(
+                records,
+                np.char.mod('%.2f', totals).tolist(),
+                np.char.mod('%.2f', allowances).tolist(),
+                np.char.mod('%.2f', bases).tolist()
+            )
+        )
         
         # Add total row
         table_data.append([
@@ -132,57 +224,20 @@ def export_salary_records_to_pdf(records: List[SalaryRecordView], filename: str
         table = Table(table_data, colWidths=[1.2*inch, 1*inch, 1*inch, 1.2*inch, 1.5*inch, 2*inch])
         
         # Add table style
-        table.setStyle(TableStyle([
-            # Header row
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            
-            # Data rows
-            ('FONTNAME', (0, 1), (-1, -2), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -2), 10),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.beige, colors.white]),
-            
-            # Total row
-            ('BACKGROUND', (0, -1), (-1, -1), colors.lightblue),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, -1), (-1, -1), 12),
-            
-            # Grid
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        table.setStyle(_SALARY_TABLE_STYLE)
         
         elements.append(table)
         
         # Add summary
         elements.append(Spacer(1, 30))
         
-        summary_style = ParagraphStyle(
-            'Summary',
-            parent=styles['Normal'],
-            fontSize=14,
-            alignment=1,
-            textColor=colors.darkblue
-        )
-        
         summary_text = f"عدد السجلات: {len(records)}<br/>الإجمالي العام: {total_sum:.2f} جنيه"
-        summary = Paragraph(summary_text, summary_style)
+        summary = Paragraph(summary_text, _SUMMARY_STYLE)
         elements.append(summary)
     
     # Add footer
     elements.append(Spacer(1, 50))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=10,
-        alignment=1,
-        textColor=colors.grey
-    )
-    
-    footer = Paragraph("نظام إدارة مرتبات العمال", footer_style)
+    footer = Paragraph("نظام إدارة مرتبات العمال", _FOOTER_STYLE)
     elements.append(footer)
     
     # Build PDF
@@ -220,93 +275,51 @@ def export_employee_summary_to_pdf(db_manager, filename: str = None) -> str:
     # Create PDF document
     doc = SimpleDocTemplate(filepath, pagesize=A4)
     elements = []
-    styles = getSampleStyleSheet()
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=30,
-        alignment=1,
-        textColor=colors.darkblue
-    )
-    
-    title = Paragraph("تقرير ملخص الموظفين والأسعار", title_style)
+    title = Paragraph("تقرير ملخص الموظفين والأسعار", _TITLE_STYLE)
     elements.append(title)
     
     # Current date
     current_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-    date_para = Paragraph(f"تاريخ التقرير: {current_date}", styles['Normal'])
+    date_para = Paragraph(f"تاريخ التقرير: {current_date}", _STYLES['Normal'])
     elements.append(date_para)
     elements.append(Spacer(1, 20))
     
     # Employees section
-    emp_title = Paragraph("قائمة الموظفين", styles['Heading2'])
+    emp_title = Paragraph("قائمة الموظفين", _STYLES['Heading2'])
     elements.append(emp_title)
     
-    emp_data = [['الرقم', 'اسم الموظف']]
-    for emp in employees:
-        emp_data.append([str(emp.id), emp.name])
+    emp_data = [['الرقم', 'اسم الموظف']] + [[str(emp.id), emp.name] for emp in employees]
     
     emp_table = Table(emp_data, colWidths=[1*inch, 4*inch])
-    emp_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-    ]))
+    emp_table.setStyle(_SIMPLE_TABLE_STYLE)
     
     elements.append(emp_table)
     elements.append(Spacer(1, 20))
     
     # Areas section
-    area_title = Paragraph("قائمة المناطق", styles['Heading2'])
+    area_title = Paragraph("قائمة المناطق", _STYLES['Heading2'])
     elements.append(area_title)
     
-    area_data = [['الرقم', 'اسم المنطقة']]
-    for area in areas:
-        area_data.append([str(area.id), area.name])
+    area_data = [['الرقم', 'اسم المنطقة']] + [[str(area.id), area.name] for area in areas]
     
     area_table = Table(area_data, colWidths=[1*inch, 4*inch])
-    area_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-    ]))
+    area_table.setStyle(_SIMPLE_TABLE_STYLE)
     
     elements.append(area_table)
     elements.append(Spacer(1, 20))
     
     # Rates section
-    rates_title = Paragraph("أسعار الموظفين حسب المناطق", styles['Heading2'])
+    rates_title = Paragraph("أسعار الموظفين حسب المناطق", _STYLES['Heading2'])
     elements.append(rates_title)
     
-    rates_data = [['الموظف', 'المنطقة', 'المرتب الأساسي']]
-    for emp_name, area_name, rate in rates:
-        rates_data.append([emp_name, area_name, f"{rate:.2f}"])
+    rates_data = [['الموظف', 'المنطقة', 'المرتب الأساسي']] + [
+        [emp_name, area_name, f"{rate:.2f}"] for emp_name, area_name, rate in rates
+    ]
     
     rates_table = Table(rates_data, colWidths=[2*inch, 2*inch, 1.5*inch])
-    rates_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.white]),
-    ]))
+    rates_table.setStyle(_RATES_TABLE_STYLE)
     
     elements.append(rates_table)
     
@@ -2,8 +2,125 @@
 Input validation utilities for Employee Salary Management System
 """
 
+import functools
 import re
-from typing import Optional, Tuple
+import string
+import sys
+from datetime import date, datetime
+from typing import Optional, Sequence, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional: validate_names_bulk falls back to NumPy
+    njit = None
+
+# Error messages, interned so UI code can compare and hash them cheaply
+_ERR_NAME_REQUIRED = sys.intern("الاسم مطلوب")
+_ERR_NAME_TOO_SHORT = sys.intern("الاسم يجب أن يكون أكثر من حرف واحد")
+_ERR_NAME_TOO_LONG = sys.intern("الاسم طويل جداً (أكثر من 100 حرف)")
+_ERR_NAME_INVALID_CHARS = sys.intern("الاسم يحتوي على أحرف غير مسموحة")
+_ERR_SALARY_REQUIRED = sys.intern("المرتب مطلوب")
+_ERR_SALARY_NEGATIVE = sys.intern("المرتب لا يمكن أن يكون سالباً")
+_ERR_SALARY_TOO_BIG = sys.intern("المرتب كبير جداً (أكثر من مليون)")
+_ERR_SALARY_INVALID = sys.intern("يرجى إدخال رقم صحيح للمرتب")
+_ERR_ALLOWANCE_NEGATIVE = sys.intern("البدل لا يمكن أن يكون سالباً")
+_ERR_ALLOWANCE_TOO_BIG = sys.intern("البدل كبير جداً (أكثر من 100 ألف)")
+_ERR_ALLOWANCE_INVALID = sys.intern("يرجى إدخال رقم صحيح للبدل")
+_ERR_EMPLOYEE_REQUIRED = sys.intern("يرجى اختيار موظف")
+_ERR_AREA_REQUIRED = sys.intern("يرجى اختيار منطقة")
+_ERR_FILENAME_REQUIRED = sys.intern("اسم الملف مطلوب")
+_ERR_DATE_ORDER = sys.intern("تاريخ البداية يجب أن يكون قبل تاريخ النهاية")
+_ERR_DATE_RANGE = sys.intern("نطاق التاريخ كبير جداً (أكثر من 5 سنوات)")
+_ERR_DATE_FORMAT = sys.intern("تنسيق التاريخ غير صحيح (يجب أن يكون YYYY-MM-DD)")
+_ERR_PHONE_INVALID = sys.intern("رقم الهاتف غير صحيح")
+
+# Shared results for the success paths
+_OK = (True, "")
+_OK_ZERO = (True, "", 0.0)
+
+# Patterns compiled once at import instead of on every call
+_ASCII_NAME_RE = re.compile(r"[A-Za-z\s.\-']+")
+
+# Characters allowed in each part of an email address (local@domain)
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+
+# Characters not allowed in filenames, each replaced by '_'
+_FN_TRANS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# Characters kept by parse_currency_input besides non-ASCII decimal digits
+_CURRENCY_KEEP = frozenset('0123456789.-')
+
+# Deletion table for the separators allowed in phone numbers: dashes,
+# parentheses and the same whitespace the regex \s class matched (none
+# exists above U+3000)
+_PHONE_STRIP = str.maketrans(dict.fromkeys(
+    [cp for cp in range(0x3001) if chr(cp).isspace()] + [ord(ch) for ch in '-()']
+))
+
+def _build_name_bitmap() -> bytes:
+    """Build a bit-per-codepoint table of the BMP characters allowed in names"""
+    bitmap = bytearray(0x10000 >> 3)
+    
+    def allow(cp: int):
+        bitmap[cp >> 3] |= 1 << (cp & 7)
+    
+    # Arabic, Arabic Supplement, Arabic Extended-A and presentation forms
+    for first, last in ((0x0600, 0x06FF), (0x0750, 0x077F), (0x08A0, 0x08FF),
+                        (0xFB50, 0xFDFF), (0xFE70, 0xFEFF)):
+        for cp in range(first, last + 1):
+            allow(cp)
+    
+    for ch in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.-'":
+        allow(ord(ch))
+    
+    # Same whitespace as the regex \s class; none exists above U+3000
+    for cp in range(0x3001):
+        if chr(cp).isspace():
+            allow(cp)
+    
+    return bytes(bitmap)
+
+# Allowed name characters, replacing a six-range Unicode regex class
+_NAME_CHARS = _build_name_bitmap()
+
+# Same table as a NumPy array for the bulk name check
+_NAME_CHARS_ARRAY = np.frombuffer(_NAME_CHARS, dtype=np.uint8)
+
+if njit is not None:
+    @njit(cache=True)
+    def _names_ok_kernel(codepoints, offsets, bitmap, out):
+        """Check each name's codepoints[offsets[i]:offsets[i + 1]] against the bitmap"""
+        for i in range(len(out)):
+            ok = True
+            for k in range(offsets[i], offsets[i + 1]):
+                cp = codepoints[k]
+                if cp > 0xFFFF or not (bitmap[cp >> 3] >> (cp & 7)) & 1:
+                    ok = False
+                    break
+            out[i] = ok
+    
+    # Compile (or load from the on-disk cache) now rather than on first use,
+    # with the same argument types validate_names_bulk passes (read-only
+    # frombuffer code points, int64 offsets)
+    _names_ok_kernel(np.frombuffer('a'.encode('utf-32-le'), dtype=np.uint32),
+                     np.array([0, 1], dtype=np.int64),
+                     _NAME_CHARS_ARRAY, np.zeros(1, dtype=np.bool_))
+else:
+    _names_ok_kernel = None
+
+# Egyptian phone number patterns as one alternation, matched in a single pass
+# (used with fullmatch, so no ^...$ anchors)
+_PHONE_RE = re.compile(r"""
+    (?:
+        01[0125][0-9]{8}     # Mobile numbers
+      | 02[0-9]{8}           # Cairo landline
+      | 03[0-9]{7}           # Alexandria landline
+      | 0[4-9][0-9]{7,8}     # Other governorates
+      | \+2[0-9]{10,11}      # International format
+    )
+""", re.VERBOSE)
 
 def validate_name(name: str) -> Tuple[bool, str]:
     """
@@ -15,52 +132,223 @@ def validate_name(name: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not name or not name.strip():
-        return False, "الاسم مطلوب"
-    
-    name = name.strip()
+    # strip() hands back the same object when there is nothing to strip,
+    # so already-clean names cost no allocation here
+    name = name.strip() if name else ''
+    if not name:
+        return False, _ERR_NAME_REQUIRED
     
     if len(name) < 2:
-        return False, "الاسم يجب أن يكون أكثر من حرف واحد"
+        return False, _ERR_NAME_TOO_SHORT
     
     if len(name) > 100:
-        return False, "الاسم طويل جداً (أكثر من 100 حرف)"
+        return False, _ERR_NAME_TOO_LONG
     
     # Check for invalid characters (allow Arabic, English, spaces, and common punctuation)
-    if not re.match(r'^[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFFa-zA-Z\s\.\-\']+$', name):
-        return False, "الاسم يحتوي على أحرف غير مسموحة"
-    
-    return True, ""
+    if name.isascii():
+        # English-only names: a single small regex beats the per-char loop
+        if not _ASCII_NAME_RE.fullmatch(name):
+            return False, _ERR_NAME_INVALID_CHARS
+        return _OK
+    
+    for ch in name:
+        cp = ord(ch)
+        if cp > 0xFFFF or not (_NAME_CHARS[cp >> 3] >> (cp & 7)) & 1:
+            return False, _ERR_NAME_INVALID_CHARS
+    
+    return _OK
 
-def validate_salary(salary: str) -> Tuple[bool, str, float]:
+def validate_names_bulk(names: Sequence[str]) -> np.ndarray:
     """
-    Validate salary amount
+    Validate many names at once, e.g. for spreadsheet imports
+    
+    Equivalent to [validate_name(n)[0] for n in names]; the character check
+    runs over all names in one compiled (Numba) or vectorized (NumPy) pass.
     
     Args:
-        salary: Salary string to validate
+        names: Names to validate
     
     Returns:
-        Tuple of (is_valid, error_message, parsed_value)
+        Boolean mask of valid names
+    """
+    valid = np.zeros(len(names), dtype=np.bool_)
+    
+    # Length checks stay in Python; only candidates reach the char check
+    candidates = []
+    positions = []
+    for i, name in enumerate(names):
+        stripped = name.strip() if name else ''
+        if 2 <= len(stripped) <= 100:
+            candidates.append(stripped)
+            positions.append(i)
+    
+    if not candidates:
+        return valid
+    
+    # surrogatepass keeps lone surrogates (e.g. from surrogateescape-decoded
+    # files) as their code points, which the bitmap rejects like validate_name
+    codepoints = np.frombuffer(''.join(candidates).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    offsets = np.zeros(len(candidates) + 1, dtype=np.int64)
+    np.cumsum([len(c) for c in candidates], out=offsets[1:])
+    
+    if _names_ok_kernel is not None:
+        ok = np.empty(len(candidates), dtype=np.bool_)
+        _names_ok_kernel(codepoints, offsets, _NAME_CHARS_ARRAY, ok)
+    else:
+        bmp = np.minimum(codepoints, 0xFFFF)
+        char_ok = (codepoints <= 0xFFFF) & ((_NAME_CHARS_ARRAY[bmp >> 3] >> (bmp & 7)) & 1).astype(np.bool_)
+        ok = np.logical_and.reduceat(char_ok, offsets[:-1])
+    
+    valid[positions] = ok
+    return valid
+
+def _parse_decimal(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a plain decimal string such as "-1250.5" exactly, without floats
+    
+    Returns:
+        Tuple of (digits, scale) meaning digits / 10**scale, or None if the
+        text is not a plain ASCII decimal (exponents, separators, "inf", ...)
     """
-    if not salary or not salary.strip():
-        return False, "المرتب مطلوب", 0.0
+    body = text[1:] if text[0] in '+-' else text
+    whole, _, frac = body.partition('.')
+    
+    if not (whole or frac) or not body.isascii():
+        return None
+    if (whole and not whole.isdigit()) or (frac and not frac.isdigit()):
+        return None
     
     try:
-        value = float(salary.strip())
+        digits = int(whole + frac)
+    except ValueError:  # Beyond the int() digit limit; let float() handle it
+        return None
+    return (-digits if text[0] == '-' else digits), len(frac)
+
+def _round_cents(digits: int, scale: int) -> int:
+    """Round a non-negative digits / 10**scale amount half up to whole cents"""
+    if scale <= 2:
+        return digits * 10 ** (2 - scale)
+    
+    unit = 10 ** (scale - 2)
+    cents, remainder = divmod(digits, unit)
+    return cents + (2 * remainder >= unit)
+
+# _parse_amount outcomes
+_AMOUNT_OK, _AMOUNT_INVALID, _AMOUNT_NEGATIVE, _AMOUNT_TOO_BIG = range(4)
+
+def _parse_amount(text: str, max_value: int) -> Tuple[int, float]:
+    """
+    Parse and range-check a stripped, non-empty money amount
+    
+    Shared by the single and bulk validators so both accept the same input.
+    
+    Args:
+        text: Amount string without surrounding whitespace
+        max_value: Largest accepted amount
+    
+    Returns:
+        Tuple of (status, value); value is rounded to cents for _AMOUNT_OK
+        and 0.0 otherwise
+    """
+    parsed = _parse_decimal(text)
+    if parsed is not None:
+        # Common case: exact integer arithmetic on the typed digits, range
+        # checked before dividing so huge inputs cannot overflow a float
+        digits, scale = parsed
         
-        if value < 0:
-            return False, "المرتب لا يمكن أن يكون سالباً", 0.0
+        if digits < 0:
+            return _AMOUNT_NEGATIVE, 0.0
         
-        if value > 1000000:  # Maximum salary limit
-            return False, "المرتب كبير جداً (أكثر من مليون)", 0.0
+        if digits > max_value * 10 ** scale:
+            return _AMOUNT_TOO_BIG, 0.0
         
-        # Round to 2 decimal places
-        value = round(value, 2)
+        return _AMOUNT_OK, _round_cents(digits, scale) / 100
+    
+    # Anything else float() accepts, e.g. "1e3" or Arabic-Indic digits
+    try:
+        value = float(text)
+    except ValueError:
+        return _AMOUNT_INVALID, 0.0
+    
+    if value != value:  # NaN passes both range checks below
+        return _AMOUNT_INVALID, 0.0
+    
+    if value < 0:
+        return _AMOUNT_NEGATIVE, 0.0
+    
+    if value > max_value:
+        return _AMOUNT_TOO_BIG, 0.0
+    
+    # Round to 2 decimal places
+    return _AMOUNT_OK, round(value, 2)
+
+def _make_amount_validator(required_msg: Optional[str], negative_msg: str, max_value: int,
+                           too_big_msg: str, invalid_msg: str):
+    """
+    Build a validator for a money amount with its limits and messages baked in
+    
+    Args:
+        required_msg: Error for empty input, or None if the amount is optional
+        negative_msg: Error for negative amounts
+        max_value: Largest accepted amount
+        too_big_msg: Error for amounts above max_value
+        invalid_msg: Error for input that is not a number
+    
+    Returns:
+        Callable taking the input string and returning
+        Tuple of (is_valid, error_message, parsed_value)
+    """
+    empty_result = _OK_ZERO if required_msg is None else (False, required_msg, 0.0)
+    errors = {
+        _AMOUNT_INVALID: (False, invalid_msg, 0.0),
+        _AMOUNT_NEGATIVE: (False, negative_msg, 0.0),
+        _AMOUNT_TOO_BIG: (False, too_big_msg, 0.0),
+    }
+    
+    def validate(amount: str) -> Tuple[bool, str, float]:
+        amount = amount.strip() if amount else ''
+        if not amount:
+            return empty_result
         
-        return True, "", value
+        status, value = _parse_amount(amount, max_value)
+        if status != _AMOUNT_OK:
+            return errors[status]
         
-    except ValueError:
-        return False, "يرجى إدخال رقم صحيح للمرتب", 0.0
+        return True, "", value
+    
+    return validate
+
+# Maximum accepted amounts
+_MAX_SALARY = 1000000
+_MAX_ALLOWANCE = 100000
+
+_salary_validator = _make_amount_validator(
+    _ERR_SALARY_REQUIRED,
+    _ERR_SALARY_NEGATIVE,
+    _MAX_SALARY,
+    _ERR_SALARY_TOO_BIG,
+    _ERR_SALARY_INVALID
+)
+
+_allowance_validator = _make_amount_validator(
+    None,  # Allowance is optional
+    _ERR_ALLOWANCE_NEGATIVE,
+    _MAX_ALLOWANCE,
+    _ERR_ALLOWANCE_TOO_BIG,
+    _ERR_ALLOWANCE_INVALID
+)
+
+def validate_salary(salary: str) -> Tuple[bool, str, float]:
+    """
+    Validate salary amount
+    
+    Args:
+        salary: Salary string to validate
+    
+    Returns:
+        Tuple of (is_valid, error_message, parsed_value)
+    """
+    return _salary_validator(salary)
 
 def validate_allowance(allowance: str) -> Tuple[bool, str, float]:
     """
@@ -72,25 +360,36 @@ def validate_allowance(allowance: str) -> Tuple[bool, str, float]:
     Returns:
         Tuple of (is_valid, error_message, parsed_value)
     """
-    if not allowance or not allowance.strip():
-        return True, "", 0.0  # Allowance is optional
+    return _allowance_validator(allowance)
+
+def _salary_or_nan(value: str) -> float:
+    """Validate one salary for bulk validation, mapping any invalid input to NaN"""
+    value = value.strip() if value else ''
+    if not value:
+        return np.nan
+    
+    status, parsed = _parse_amount(value, _MAX_SALARY)
+    return parsed if status == _AMOUNT_OK else np.nan
+
+def validate_salaries_bulk(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Validate many salary strings at once, e.g. for bulk imports
     
-    try:
-        value = float(allowance.strip())
-        
-        if value < 0:
-            return False, "البدل لا يمكن أن يكون سالباً", 0.0
-        
-        if value > 100000:  # Maximum allowance limit
-            return False, "البدل كبير جداً (أكثر من 100 ألف)", 0.0
-        
-        # Round to 2 decimal places
-        value = round(value, 2)
-        
-        return True, "", value
-        
-    except ValueError:
-        return False, "يرجى إدخال رقم صحيح للبدل", 0.0
+    Each entry is checked exactly like validate_salary; the results are
+    collected straight into NumPy arrays. Empty entries are invalid.
+    
+    Args:
+        values: Salary strings to validate
+    
+    Returns:
+        Tuple of (valid_mask, parsed_values); invalid entries are 0.0
+    """
+    arr = np.fromiter(map(_salary_or_nan, values), dtype=np.float64, count=len(values))
+    
+    valid = ~np.isnan(arr)
+    parsed = np.where(valid, arr, 0.0)
+    
+    return valid, parsed
 
 def validate_employee_selection(employee_id: Optional[int], employee_name: str) -> Tuple[bool, str]:
     """
@@ -104,9 +403,9 @@ def validate_employee_selection(employee_id: Optional[int], employee_name: str)
         Tuple of (is_valid, error_message)
     """
     if not employee_id or not employee_name:
-        return False, "يرجى اختيار موظف"
+        return False, _ERR_EMPLOYEE_REQUIRED
     
-    return True, ""
+    return _OK
 
 def validate_area_selection(area_id: Optional[int], area_name: str) -> Tuple[bool, str]:
     """
@@ -120,10 +419,11 @@ def validate_area_selection(area_id: Optional[int], area_name: str) -> Tuple[boo
         Tuple of (is_valid, error_message)
     """
     if not area_id or not area_name:
-        return False, "يرجى اختيار منطقة"
+        return False, _ERR_AREA_REQUIRED
     
-    return True, ""
+    return _OK
 
+@functools.lru_cache(maxsize=256)  # The UI re-validates the same name as focus moves
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for safe file operations
@@ -137,21 +437,9 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return "untitled"
     
-    # Remove or replace invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
-    # Remove leading/trailing spaces and dots
-    filename = filename.strip(' .')
-    
-    # Limit length
-    if len(filename) > 200:
-        filename = filename[:200]
-    
-    # Ensure it's not empty after sanitization
-    if not filename:
-        filename = "untitled"
-    
-    return filename
+    # Replace invalid characters, remove leading/trailing spaces and dots,
+    # limit the length and ensure it's not empty after sanitization
+    return filename.translate(_FN_TRANS).strip(' .')[:200] or "untitled"
 
 def validate_pdf_filename(filename: str) -> Tuple[bool, str, str]:
     """
@@ -163,17 +451,23 @@ def validate_pdf_filename(filename: str) -> Tuple[bool, str, str]:
     Returns:
         Tuple of (is_valid, error_message, sanitized_filename)
     """
-    if not filename or not filename.strip():
-        return False, "اسم الملف مطلوب", ""
+    filename = filename.strip() if filename else ''
+    if not filename:
+        return False, _ERR_FILENAME_REQUIRED, ""
     
-    sanitized = sanitize_filename(filename.strip())
+    sanitized = sanitize_filename(filename)
     
-    # Ensure .pdf extension
-    if not sanitized.lower().endswith('.pdf'):
+    # Ensure .pdf extension (lowercase only the tail, not the whole name)
+    if sanitized[-4:].lower() != '.pdf':
         sanitized += '.pdf'
     
     return True, "", sanitized
 
+@functools.lru_cache(maxsize=1024)
+def _format_currency_cached(amount: float, currency: str) -> str:
+    """Memoized formatting; totals rows repeat the same amounts a lot"""
+    return f"{amount:,.2f} {currency}"
+
 def format_currency(amount: float, currency: str = "جنيه") -> str:
     """
     Format currency amount for display
@@ -185,7 +479,14 @@ def format_currency(amount: float, currency: str = "جنيه") -> str:
     Returns:
         Formatted currency string
     """
-    return f"{amount:,.2f} {currency}"
+    amount = round(amount, 2)
+    
+    # NaN never equals a cached key, and 0.0 == -0.0 would share an entry
+    # although they format differently, so both bypass the cache
+    if amount != amount or not amount:
+        return f"{amount:,.2f} {currency}"
+    
+    return _format_currency_cached(amount, currency)
 
 def parse_currency_input(input_str: str) -> Optional[float]:
     """
@@ -201,13 +502,30 @@ def parse_currency_input(input_str: str) -> Optional[float]:
         return None
     
     # Remove common currency symbols and text
-    cleaned = re.sub(r'[^\d\.\-]', '', input_str.strip())
+    # isdecimal() keeps the other digits the regex \d used to match (e.g. Arabic-Indic)
+    cleaned = ''.join(c for c in input_str.strip() if c in _CURRENCY_KEEP or c.isdecimal())
     
     try:
         return float(cleaned)
     except ValueError:
         return None
 
+def _parse_ymd(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD string without strptime's format interpreter
+    
+    Strings that do not have the exact zero-padded shape (e.g. 2024-1-5)
+    fall back to strptime, which still accepts them.
+    
+    Raises:
+        ValueError: If the string is not a valid date
+    """
+    if (len(value) == 10 and value[4] == '-' and value[7] == '-' and value.isascii()
+            and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()):
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+    
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
 def validate_date_range(start_date: str, end_date: str) -> Tuple[bool, str]:
     """
     Validate date range for reports
@@ -219,23 +537,21 @@ def validate_date_range(start_date: str, end_date: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    from datetime import datetime
-    
     try:
-        start = datetime.strptime(start_date, '%Y-%m-%d')
-        end = datetime.strptime(end_date, '%Y-%m-%d')
+        start = _parse_ymd(start_date)
+        end = _parse_ymd(end_date)
         
         if start > end:
-            return False, "تاريخ البداية يجب أن يكون قبل تاريخ النهاية"
+            return False, _ERR_DATE_ORDER
         
         # Check if date range is reasonable (not more than 5 years)
         if (end - start).days > 1825:  # 5 years
-            return False, "نطاق التاريخ كبير جداً (أكثر من 5 سنوات)"
+            return False, _ERR_DATE_RANGE
         
-        return True, ""
+        return _OK
         
     except ValueError:
-        return False, "تنسيق التاريخ غير صحيح (يجب أن يكون YYYY-MM-DD)"
+        return False, _ERR_DATE_FORMAT
 
 def is_valid_email(email: str) -> bool:
     """
@@ -250,8 +566,17 @@ def is_valid_email(email: str) -> bool:
     if not email:
         return False
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # Single pass over local@host.tld instead of a backtracking regex
+    local, at, domain = email.partition('@')
+    if not local or not at or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+    
+    host, dot, tld = domain.rpartition('.')
+    if not host or not dot or not _EMAIL_DOMAIN_CHARS.issuperset(host):
+        return False
+    
+    # Top-level domain: two or more ASCII letters
+    return len(tld) >= 2 and tld.isascii() and tld.isalpha()
 
 def validate_phone_number(phone: str) -> Tuple[bool, str]:
     """
@@ -263,23 +588,14 @@ def validate_phone_number(phone: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not phone or not phone.strip():
-        return True, ""  # Phone is optional
+    phone = phone.strip() if phone else ''
+    if not phone:
+        return _OK  # Phone is optional
     
     # Remove spaces, dashes, and parentheses
-    cleaned = re.sub(r'[\s\-\(\)]', '', phone.strip())
-    
-    # Check Egyptian phone number patterns
-    patterns = [
-        r'^01[0125][0-9]{8}$',  # Mobile numbers
-        r'^02[0-9]{8}$',        # Cairo landline
-        r'^03[0-9]{7}$',        # Alexandria landline
-        r'^0[4-9][0-9]{7,8}$',  # Other governorates
-        r'^\+2[0-9]{10,11}$'    # International format
-    ]
-    
-    for pattern in patterns:
-        if re.match(pattern, cleaned):
-            return True, ""
-    
-    return False, "رقم الهاتف غير صحيح"
+    cleaned = phone.translate(_PHONE_STRIP)
+    
+    if _PHONE_RE.fullmatch(cleaned):
+        return _OK
+    
+    return False, _ERR_PHONE_INVALID